@@ -5,6 +5,24 @@ from pyflink.common import Types, Row
 
 from utils import serialize
 
+ONE_MINUTE = datetime.timedelta(minutes=1)
+
+FLIGHT_FIELDS = (
+    "email_address",
+    "departure_time",
+    "departure_airport_code",
+    "arrival_time",
+    "arrival_airport_code",
+    "flight_number",
+    "confirmation",
+    "source",
+)
+FLIGHT_ROW = Row(*FLIGHT_FIELDS)
+FLIGHT_TYPE = Types.ROW_NAMED(
+    field_names=list(FLIGHT_FIELDS),
+    field_types=[Types.STRING() for _ in FLIGHT_FIELDS],
+)
+
 
 @dataclasses.dataclass
 class FlightData:
@@ -18,24 +36,21 @@ class FlightData:
     source: str
 
     def get_duration(self):
-        return int(
-            (
-                datetime.datetime.fromisoformat(self.arrival_time)
-                - datetime.datetime.fromisoformat(self.departure_time)
-            ).seconds
-            / 60
-        )
+        return (
+            datetime.datetime.fromisoformat(self.arrival_time)
+            - datetime.datetime.fromisoformat(self.departure_time)
+        ) // ONE_MINUTE
 
     def to_row(self):
-        return Row(
-            email_address=self.email_address,
-            departure_time=serialize(self.departure_time),
-            departure_airport_code=self.departure_airport_code,
-            arrival_time=serialize(self.arrival_time),
-            arrival_airport_code=self.arrival_airport_code,
-            flight_number=self.flight_number,
-            confirmation=self.confirmation,
-            source=self.source,
+        return FLIGHT_ROW(
+            self.email_address,
+            serialize(self.departure_time),
+            self.departure_airport_code,
+            serialize(self.arrival_time),
+            self.arrival_airport_code,
+            self.flight_number,
+            self.confirmation,
+            self.source,
         )
 
     @classmethod
@@ -64,28 +79,7 @@ class FlightData:
 
     @staticmethod
     def get_value_type_info():
-        return Types.ROW_NAMED(
-            field_names=[
-                "email_address",
-                "departure_time",
-                "departure_airport_code",
-                "arrival_time",
-                "arrival_airport_code",
-                "flight_number",
-                "confirmation",
-                "source",
-            ],
-            field_types=[
-                Types.STRING(),
-                Types.STRING(),
-                Types.STRING(),
-                Types.STRING(),
-                Types.STRING(),
-                Types.STRING(),
-                Types.STRING(),
-                Types.STRING(),
-            ],
-        )
+        return FLIGHT_TYPE
 
     @staticmethod
     def to_user_statistics_data(row: Row):
@@ -7,7 +7,7 @@ from pyflink.common import WatermarkStrategy
 from pyflink.common.watermark_strategy import TimestampAssigner
 from pyflink.datastream import StreamExecutionEnvironment
 
-from models import UserStatistics
+from models import FlightData, UserStatistics
 from helpers import build_flight, build_user_statistics
 from s18_aggregation import define_workflow
 
@@ -15,6 +15,10 @@ from s18_aggregation import define_workflow
 @pytest.fixture(scope="module")
 def env():
     env = StreamExecutionEnvironment.get_execution_environment()
+    env.set_parallelism(1)
+    env.set_buffer_timeout(0)
+    env.get_config().enable_object_reuse()
+    env.get_config().set_auto_watermark_interval(0)
     yield env
 
 
@@ -22,7 +26,7 @@ def env():
 def default_watermark_strategy():
     class DefaultTimestampAssigner(TimestampAssigner):
         def extract_timestamp(self, value, record_timestamp):
-            return int(time.time_ns() / 1000000)
+            return time.time_ns() // 1000000
 
     return WatermarkStrategy.for_monotonous_timestamps().with_timestamp_assigner(
         DefaultTimestampAssigner()
@@ -46,6 +50,16 @@ def test_user_statistics_should_create_statistics_using_flight_data():
     assert 1 == stats.number_of_flights
 
 
+def test_user_statistics_should_create_statistics_using_flight_data_with_offset():
+    flight = build_flight()
+    flight.departure_time = "2023-01-01T23:30:00.000+10:00"
+    flight.arrival_time = "2023-01-02T00:45:00.000+10:00"
+
+    stats = UserStatistics.from_flight(flight)
+
+    assert 75 == stats.total_flight_duration
+
+
 def test_user_statistics_should_merge_two_user_statistics():
     stats1 = build_user_statistics()
     stats2 = build_user_statistics(email_address=stats1.email_address)
@@ -73,17 +87,17 @@ def test_define_workflow_should_convert_flight_data_to_user_statistics(
 ):
     flight_data = build_flight()
     flight_stream = env.from_collection(
-        collection=[flight_data.to_row()]
+        collection=[flight_data.to_row()], type_info=FlightData.get_value_type_info()
     ).assign_timestamps_and_watermarks(default_watermark_strategy)
 
-    elements: typing.List[UserStatistics] = list(
-        define_workflow(flight_stream).execute_and_collect()
-    )
+    with define_workflow(flight_stream).execute_and_collect() as results:
+        elements: typing.List[UserStatistics] = list(results)
     expected = UserStatistics.from_flight(flight_data)
 
-    assert expected.email_address == next(iter(elements)).email_address
-    assert expected.total_flight_duration == next(iter(elements)).total_flight_duration
-    assert expected.number_of_flights == next(iter(elements)).number_of_flights
+    first = elements[0]
+    assert expected.email_address == first.email_address
+    assert expected.total_flight_duration == first.total_flight_duration
+    assert expected.number_of_flights == first.number_of_flights
 
 
 def test_define_workflow_should_group_statistics_by_email_address(env, default_watermark_strategy):
@@ -93,12 +107,12 @@ def test_define_workflow_should_group_statistics_by_email_address(env, default_w
     flight_data_3.email_address = flight_data_1.email_address
 
     flight_stream = env.from_collection(
-        collection=[flight_data_1.to_row(), flight_data_2.to_row(), flight_data_3.to_row()]
+        collection=[flight_data_1.to_row(), flight_data_2.to_row(), flight_data_3.to_row()],
+        type_info=FlightData.get_value_type_info(),
     ).assign_timestamps_and_watermarks(default_watermark_strategy)
 
-    elements: typing.List[UserStatistics] = list(
-        define_workflow(flight_stream).execute_and_collect()
-    )
+    with define_workflow(flight_stream).execute_and_collect() as results:
+        elements: typing.List[UserStatistics] = list(results)
 
     expected_1 = UserStatistics.merge(
         UserStatistics.from_flight(flight_data_1), UserStatistics.from_flight(flight_data_3)
@@ -126,11 +140,10 @@ def test_define_workflow_should_window_statistics_by_minute(env):
     class CustomTimestampAssigner(TimestampAssigner):
         def extract_timestamp(self, value, record_timestamp):
             if value.departure_airport_code == "LATE":
-                # higher than 27300 makes a separate window
-                # shouldn't it be values lower than 60000???
-                return int(time.time_ns() / 1000000) + 60000
+                # windows fire on the end-of-input watermark, a minute later is always the next window
+                return time.time_ns() // 1000000 + 60000
             else:
-                return int(time.time_ns() / 1000000)
+                return time.time_ns() // 1000000
 
     custom_watermark_strategy = (
         WatermarkStrategy.for_monotonous_timestamps().with_timestamp_assigner(
@@ -139,12 +152,12 @@ def test_define_workflow_should_window_statistics_by_minute(env):
     )
 
     flight_stream = env.from_collection(
-        collection=[flight_data_1.to_row(), flight_data_2.to_row(), flight_data_3.to_row()]
+        collection=[flight_data_1.to_row(), flight_data_2.to_row(), flight_data_3.to_row()],
+        type_info=FlightData.get_value_type_info(),
     ).assign_timestamps_and_watermarks(custom_watermark_strategy)
 
-    elements: typing.List[UserStatistics] = list(
-        define_workflow(flight_stream).execute_and_collect()
-    )
+    with define_workflow(flight_stream).execute_and_collect() as results:
+        elements: typing.List[UserStatistics] = list(results)
 
     expected_1 = UserStatistics.merge(
         UserStatistics.from_flight(flight_data_1), UserStatistics.from_flight(flight_data_2)
@@ -1,5 +1,6 @@
 import os
 import json
+import functools
 import logging
 
 from pyflink.table import EnvironmentSettings, TableEnvironment
@@ -38,12 +39,11 @@ if RUNTIME_ENV != "KDA":
 logging.info(f"app properties file path - {APPLICATION_PROPERTIES_FILE_PATH}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_application_properties():
     if os.path.isfile(APPLICATION_PROPERTIES_FILE_PATH):
         with open(APPLICATION_PROPERTIES_FILE_PATH, "r") as file:
-            contents = file.read()
-            properties = json.loads(contents)
-            return properties
+            return json.load(file)
     else:
         raise RuntimeError(f"A file at '{APPLICATION_PROPERTIES_FILE_PATH}' was not found")
 
@@ -54,10 +54,7 @@ def property_map(props: dict, property_group_id: str):
             return prop["PropertyMap"]
 
 
-def create_source_table(
-    table_name: str, topic_name: str, bootstrap_servers: str, startup_mode: str
-):
-    stmt = f"""
+SOURCE_TABLE_DDL = """
     CREATE TABLE {table_name} (
         event_time TIMESTAMP(3),
         ticker VARCHAR(6),
@@ -72,13 +69,8 @@ def create_source_table(
         'scan.startup.mode' = '{startup_mode}'
     )
     """
-    logging.info("source table statement...")
-    logging.info(stmt)
-    return stmt
-
 
-def create_sink_table(table_name: str, topic_name: str, bootstrap_servers: str):
-    stmt = f"""
+SINK_TABLE_DDL = """
     CREATE TABLE {table_name} (
         event_time TIMESTAMP(3),
         ticker VARCHAR(6),
@@ -87,20 +79,18 @@ def create_sink_table(table_name: str, topic_name: str, bootstrap_servers: str):
     WITH (
         'connector' = 'kafka',
         'topic' = '{topic_name}',
-        'properties.bootstrap.servers' = '{bootstrap_servers}',        
+        'properties.bootstrap.servers' = '{bootstrap_servers}',
         'format' = 'json',
         'key.format' = 'json',
         'key.fields' = 'ticker',
-        'properties.allow.auto.create.topics' = 'true'
+        'properties.allow.auto.create.topics' = 'true',
+        'properties.compression.type' = 'lz4',
+        'properties.linger.ms' = '20',
+        'properties.batch.size' = '524288'
     )
     """
-    logging.info("sint table statement...")
-    logging.info(stmt)
-    return stmt
-
 
-def create_print_table(table_name: str):
-    return f"""
+PRINT_TABLE_DDL = """
     CREATE TABLE {table_name} (
         event_time TIMESTAMP(3),
         ticker VARCHAR(6),
@@ -112,6 +102,33 @@ def create_print_table(table_name: str):
     """
 
 
+def create_source_table(
+    table_name: str, topic_name: str, bootstrap_servers: str, startup_mode: str
+):
+    stmt = SOURCE_TABLE_DDL.format(
+        table_name=table_name,
+        topic_name=topic_name,
+        bootstrap_servers=bootstrap_servers,
+        startup_mode=startup_mode,
+    )
+    logging.info("source table statement...")
+    logging.info(stmt)
+    return stmt
+
+
+def create_sink_table(table_name: str, topic_name: str, bootstrap_servers: str):
+    stmt = SINK_TABLE_DDL.format(
+        table_name=table_name, topic_name=topic_name, bootstrap_servers=bootstrap_servers
+    )
+    logging.info("sint table statement...")
+    logging.info(stmt)
+    return stmt
+
+
+def create_print_table(table_name: str):
+    return PRINT_TABLE_DDL.format(table_name=table_name)
+
+
 def main():
     ## map consumer/producer properties
     props = get_application_properties()
@@ -1,5 +1,6 @@
 import os
 import json
+import functools
 import re
 import logging
 
@@ -37,12 +38,11 @@ if RUNTIME_ENV != "KDA":
 logging.info(f"app properties file path - {APPLICATION_PROPERTIES_FILE_PATH}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_application_properties():
     if os.path.isfile(APPLICATION_PROPERTIES_FILE_PATH):
         with open(APPLICATION_PROPERTIES_FILE_PATH, "r") as file:
-            contents = file.read()
-            properties = json.loads(contents)
-            return properties
+            return json.load(file)
     else:
         raise RuntimeError(f"A file at '{APPLICATION_PROPERTIES_FILE_PATH}' was not found")
 
@@ -53,6 +53,29 @@ def property_map(props: dict, property_group_id: str):
             return prop["PropertyMap"]
 
 
+KAFKA_TABLE_DDL = """
+    CREATE TABLE {table_name} (
+        event_time TIMESTAMP(3),
+        ticker VARCHAR(6),
+        price DOUBLE
+    )
+    WITH (
+        {opts}
+    )
+    """
+
+PRINT_TABLE_DDL = """
+    CREATE TABLE {table_name} (
+        event_time TIMESTAMP(3),
+        ticker VARCHAR(6),
+        price DOUBLE
+    )
+    WITH (
+        'connector' = 'print'
+    )
+    """
+
+
 def inject_security_opts(opts: dict, bootstrap_servers: str):
     if re.search("9098$", bootstrap_servers):
         opts = {
@@ -78,16 +101,9 @@ def create_source_table(
         "format": "json",
         "scan.startup.mode": startup_mode,
     }
-    stmt = f"""
-    CREATE TABLE {table_name} (
-        event_time TIMESTAMP(3),
-        ticker VARCHAR(6),
-        price DOUBLE
-    )
-    WITH (
-        {inject_security_opts(opts, bootstrap_servers)}
+    stmt = KAFKA_TABLE_DDL.format(
+        table_name=table_name, opts=inject_security_opts(opts, bootstrap_servers)
     )
-    """
     logging.info("source table statement...")
     logging.info(stmt)
     return stmt
@@ -102,33 +118,20 @@ def create_sink_table(table_name: str, topic_name: str, bootstrap_servers: str):
         "key.format": "json",
         "key.fields": "ticker",
         "properties.allow.auto.create.topics": "true",
+        "properties.compression.type": "lz4",
+        "properties.linger.ms": "20",
+        "properties.batch.size": "524288",
     }
-    stmt = f"""
-    CREATE TABLE {table_name} (
-        event_time TIMESTAMP(3),
-        ticker VARCHAR(6),
-        price DOUBLE
-    )
-    WITH (
-        {inject_security_opts(opts, bootstrap_servers)}
+    stmt = KAFKA_TABLE_DDL.format(
+        table_name=table_name, opts=inject_security_opts(opts, bootstrap_servers)
     )
-    """
     logging.info("sink table statement...")
     logging.info(stmt)
     return stmt
 
 
 def create_print_table(table_name: str):
-    return f"""
-    CREATE TABLE {table_name} (
-        event_time TIMESTAMP(3),
-        ticker VARCHAR(6),
-        price DOUBLE
-    )
-    WITH (
-        'connector' = 'print'
-    )
-    """
+    return PRINT_TABLE_DDL.format(table_name=table_name)
 
 
 def main():
@@ -30,6 +30,8 @@ table_env.execute_sql(
         'properties.group.id' = 'source-demo',
         'format' = 'json',
         'scan.startup.mode' = 'earliest-offset',
+        'properties.fetch.min.bytes' = '131072',
+        'properties.max.poll.records' = '1000',
         'json.fail-on-missing-field' = 'false',
         'json.ignore-parse-errors' = 'true'
     )
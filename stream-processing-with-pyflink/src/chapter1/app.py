@@ -2,14 +2,13 @@ import os
 import datetime
 from typing import Iterable, Tuple
 
-from pyflink.common import Row, WatermarkStrategy
+from pyflink.common import Configuration, Row
 from pyflink.common.typeinfo import Types
-from pyflink.common.watermark_strategy import TimestampAssigner, Duration
 from pyflink.datastream import DataStream
 from pyflink.datastream import StreamExecutionEnvironment, RuntimeExecutionMode
 from pyflink.datastream.window import TumblingEventTimeWindows, Time
-from pyflink.datastream.functions import ProcessWindowFunction
-from pyflink.table import StreamTableEnvironment
+from pyflink.datastream.functions import AggregateFunction, KeySelector, ProcessWindowFunction
+from pyflink.table import StreamTableEnvironment, Table
 from pyflink.datastream.connectors.kafka import (
     KafkaSink,
     KafkaRecordSerializationSchema,
@@ -19,32 +18,80 @@ from pyflink.datastream.formats.json import JsonRowSerializationSchema
 
 from utils.model import SensorReading
 
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+JAR_FILES = ["flink-faker-0.5.3.jar", "flink-sql-connector-kafka-1.17.1.jar"]
+JAR_PATHS = tuple(os.path.join(SRC_DIR, "jars", name) for name in JAR_FILES)
+JAR_URLS = tuple(f"file://{path}" for path in JAR_PATHS)
 
-class AggreteProcessWindowFunction(ProcessWindowFunction):
+
+class SensorIdKeySelector(KeySelector):
+    def get_key(self, value: Tuple[int, int, datetime.datetime]) -> int:
+        return value[0]
+
+
+class AvgTempFunction(AggregateFunction):
+    def create_accumulator(self) -> Tuple[float, int]:
+        return 0.0, 0
+
+    def add(
+        self, value: Tuple[int, int, datetime.datetime], accumulator: Tuple[float, int]
+    ) -> Tuple[float, int]:
+        return accumulator[0] + value[1] * 0.2 + 65, accumulator[1] + 1
+
+    def get_result(self, accumulator: Tuple[float, int]) -> Tuple[float, int]:
+        return accumulator[0] / accumulator[1], accumulator[1]
+
+    def merge(self, acc_a: Tuple[float, int], acc_b: Tuple[float, int]) -> Tuple[float, int]:
+        return acc_a[0] + acc_b[0], acc_a[1] + acc_b[1]
+
+
+class WindowEndProcessFunction(ProcessWindowFunction):
     def process(
         self,
         key: int,
         context: ProcessWindowFunction.Context,
-        elements: Iterable[Tuple[int, int, datetime.datetime]],
-    ) -> Iterable[SensorReading]:
-        id, count, temperature = SensorReading.process_elements(elements)
+        elements: Iterable[Tuple[float, int]],
+    ) -> Iterable[Row]:
+        temperature, count = next(iter(elements))
         yield SensorReading(
-            id=id,
+            id=f"sensor_{key}",
             timestamp=int(context.window().end),
             num_records=count,
-            temperature=round(temperature / count, 2),
-        )
+            temperature=round(temperature, 2),
+        ).to_row()
 
 
 def define_workflow(source_stream: DataStream):
     sensor_stream = (
-        source_stream.key_by(lambda e: e[0])
+        source_stream.key_by(SensorIdKeySelector(), key_type=Types.INT())
         .window(TumblingEventTimeWindows.of(Time.seconds(1)))
-        .process(AggreteProcessWindowFunction())
+        .aggregate(
+            AvgTempFunction(),
+            window_function=WindowEndProcessFunction(),
+            accumulator_type=Types.TUPLE([Types.DOUBLE(), Types.LONG()]),
+            output_type=SensorReading.set_value_type_info(),
+        )
     )
     return sensor_stream
 
 
+def define_sql_workflow(t_env: StreamTableEnvironment) -> Table:
+    return t_env.sql_query(
+        """
+        SELECT
+            CONCAT('sensor_', CAST(`id` AS STRING)) AS `id`,
+            -- window_time is the window end minus 1 ms as an instant, casting gives epoch seconds
+            (CAST(window_time AS BIGINT) + 1) * 1000 AS `timestamp`,
+            CAST(COUNT(*) AS INT) AS `num_records`,
+            ROUND(AVG(CAST(`rn` AS DOUBLE) * 0.2 + 65), 2) AS `temperature`
+        FROM TABLE(
+            TUMBLE(TABLE sensor_source, DESCRIPTOR(log_time), INTERVAL '1' SECOND)
+        )
+        GROUP BY `id`, window_start, window_end, window_time
+        """
+    )
+
+
 if __name__ == "__main__":
     """
     ## local execution
@@ -60,14 +107,30 @@ if __name__ == "__main__":
     RUNTIME_ENV = os.getenv("RUNTIME_ENV", "local")
     BOOTSTRAP_SERVERS = os.getenv("BOOTSTRAP_SERVERS", "localhost:29092")
 
-    env = StreamExecutionEnvironment.get_execution_environment()
+    # check local jars before the jvm is launched
+    if RUNTIME_ENV == "local":
+        missing_jars = [path for path in JAR_PATHS if not os.path.isfile(path)]
+        if missing_jars:
+            raise RuntimeError(f"Jar files not found - {', '.join(missing_jars)}")
+
+    config = Configuration()
+    config.set_string("state.backend", "rocksdb")
+    config.set_string("state.backend.incremental", "true")
+    config.set_string("state.backend.rocksdb.memory.managed", "true")
+    config.set_string("state.backend.rocksdb.memory.write-buffer-ratio", "0.5")
+    config.set_string(
+        "state.backend.rocksdb.predefined-options", "SPINNING_DISK_OPTIMIZED_HIGH_MEM"
+    )
+    config.set_string("taskmanager.memory.managed.fraction", "0.6")
+
+    env = StreamExecutionEnvironment.get_execution_environment(config)
     env.set_runtime_mode(RuntimeExecutionMode.STREAMING)
+    env.get_config().enable_object_reuse()
+    env.get_checkpoint_config().set_checkpoint_interval(60000)
+    env.get_checkpoint_config().set_min_pause_between_checkpoints(30000)
     if RUNTIME_ENV == "local":
-        SRC_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-        jar_files = ["flink-faker-0.5.3.jar", "flink-sql-connector-kafka-1.17.1.jar"]
-        jar_paths = tuple([f"file://{os.path.join(SRC_DIR, 'jars', name)}" for name in jar_files])
-        print(jar_paths)
-        env.add_jars(*jar_paths)
+        print(JAR_URLS)
+        env.add_jars(*JAR_URLS)
 
     t_env = StreamTableEnvironment.create(stream_execution_environment=env)
     t_env.get_config().set_local_timezone("Australia/Sydney")
@@ -76,7 +139,8 @@ if __name__ == "__main__":
         CREATE TABLE sensor_source (
             `id`        INT,
             `rn`        INT,
-            `log_time`  TIMESTAMP_LTZ(3)
+            `log_time`  TIMESTAMP_LTZ(3),
+            WATERMARK FOR `log_time` AS `log_time` - INTERVAL '5' SECOND
         )
         WITH (
             'connector' = 'faker',
@@ -88,21 +152,6 @@ if __name__ == "__main__":
         """
     )
 
-    class SourceTimestampAssigner(TimestampAssigner):
-        def extract_timestamp(
-            self, value: Tuple[int, int, datetime.datetime], record_timestamp: int
-        ):
-            return int(value[2].strftime("%s")) * 1000
-
-    source_stream = t_env.to_append_stream(
-        t_env.from_path("sensor_source"),
-        Types.TUPLE([Types.INT(), Types.INT(), Types.SQL_TIMESTAMP()]),
-    ).assign_timestamps_and_watermarks(
-        WatermarkStrategy.for_bounded_out_of_orderness(
-            Duration.of_seconds(5)
-        ).with_timestamp_assigner(SourceTimestampAssigner())
-    )
-
     sensor_sink = (
         KafkaSink.builder()
         .set_bootstrap_servers(BOOTSTRAP_SERVERS)
@@ -125,9 +174,9 @@ if __name__ == "__main__":
         .build()
     )
 
-    define_workflow(source_stream).print()
-    # define_workflow(source_stream).map(
-    #     SensorReading.to_row, output_type=SensorReading.set_value_type_info()
-    # ).sink_to(sensor_sink).name("sensor_sink").uid("sensor_sink")
+    # aggregate in the sql runtime, define_workflow is kept as the datastream equivalent
+    sensor_stream = t_env.to_data_stream(define_sql_workflow(t_env))
+    sensor_stream.print()
+    # sensor_stream.sink_to(sensor_sink).name("sensor_sink").uid("sensor_sink")
 
     env.execute("Compute average sensor temperature")
@@ -2,12 +2,17 @@ import datetime
 from typing import List, Tuple
 
 import pytest
-from pyflink.common import WatermarkStrategy
+from pyflink.common import Row, WatermarkStrategy
+from pyflink.common.typeinfo import Types
 from pyflink.common.watermark_strategy import TimestampAssigner, Duration
 from pyflink.datastream import DataStream, StreamExecutionEnvironment
+from pyflink.table import DataTypes, Schema, StreamTableEnvironment
 
 from utils.model import SensorReading
-from app import define_workflow
+from app import AvgTempFunction, define_workflow, define_sql_workflow
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
 
 
 @pytest.fixture(scope="module")
@@ -16,15 +21,32 @@ def env():
     yield env
 
 
+@pytest.fixture(scope="module")
+def t_env(env):
+    t_env = StreamTableEnvironment.create(stream_execution_environment=env)
+    t_env.get_config().set_local_timezone("Australia/Sydney")
+    yield t_env
+
+
 def test_process_elements_return_correct_id_and_count():
     elements = [(1, 0, datetime.datetime.now()), (1, 0, datetime.datetime.now())]
-    id, count, temperature = SensorReading.process_elements(elements)
+    sensor_id, count, temperature = SensorReading.process_elements(elements)
 
-    assert id == "sensor_1"
+    assert sensor_id == 1
     assert count == 2
     assert temperature == 65 * 2
 
 
+def test_avg_temp_function_should_accumulate_and_merge_temperature():
+    func = AvgTempFunction()
+    acc_a = func.add((1, 0, datetime.datetime.now()), func.create_accumulator())
+    acc_a = func.add((1, 100, datetime.datetime.now()), acc_a)
+    acc_b = func.add((1, 50, datetime.datetime.now()), func.create_accumulator())
+
+    assert func.get_result(acc_a) == (75, 2)
+    assert func.get_result(func.merge(acc_a, acc_b)) == (75, 3)
+
+
 def test_define_workflow_should_aggregate_values_by_id(env):
     source_1 = (1, 0, datetime.datetime.now())
     source_2 = (1, 0, datetime.datetime.now() + datetime.timedelta(milliseconds=200))
@@ -34,7 +56,7 @@ def test_define_workflow_should_aggregate_values_by_id(env):
         def extract_timestamp(
             self, value: Tuple[int, int, datetime.datetime], record_timestamp: int
         ):
-            return int(value[2].strftime("%s")) * 1000
+            return (value[2] - _EPOCH) // _MILLISECOND
 
     source_stream: DataStream = env.from_collection(
         collection=[source_1, source_2, source_3]
@@ -65,7 +87,7 @@ def test_define_workflow_should_aggregate_values_by_minute(env):
         def extract_timestamp(
             self, value: Tuple[int, int, datetime.datetime], record_timestamp: int
         ):
-            return int(value[2].strftime("%s")) * 1000
+            return (value[2] - _EPOCH) // _MILLISECOND
 
     source_stream: DataStream = env.from_collection(
         collection=[source_1, source_2, source_3]
@@ -83,3 +105,44 @@ def test_define_workflow_should_aggregate_values_by_minute(env):
             assert e.temperature == 65
         else:
             raise RuntimeError("records grouped incorrectly")
+
+
+def test_define_sql_workflow_should_aggregate_values_by_id_and_window(env, t_env):
+    # 2023-04-02 02:30 in Sydney, inside the hour repeated when daylight saving ends
+    window_start = 1680366600000
+    source_1 = Row(1, 0, window_start + 100)
+    source_2 = Row(1, 100, window_start + 200)
+    source_3 = Row(2, 20, window_start + 300)
+    source_4 = Row(1, 50, window_start + 1100)
+
+    class SourceTimestampAssigner(TimestampAssigner):
+        def extract_timestamp(self, value: Row, record_timestamp: int):
+            return value[2]
+
+    source_stream: DataStream = env.from_collection(
+        collection=[source_1, source_2, source_3, source_4],
+        type_info=Types.ROW_NAMED(["id", "rn", "ts"], [Types.INT(), Types.INT(), Types.LONG()]),
+    ).assign_timestamps_and_watermarks(
+        WatermarkStrategy.for_bounded_out_of_orderness(
+            Duration.of_seconds(5)
+        ).with_timestamp_assigner(SourceTimestampAssigner())
+    )
+    t_env.create_temporary_view(
+        "sensor_source",
+        t_env.from_data_stream(
+            source_stream,
+            Schema.new_builder()
+            .column_by_metadata("log_time", DataTypes.TIMESTAMP_LTZ(3), "rowtime")
+            .watermark("log_time", "SOURCE_WATERMARK()")
+            .build(),
+        ),
+    )
+
+    with define_sql_workflow(t_env).execute().collect() as results:
+        elements = {tuple(e) for e in results}
+
+    assert elements == {
+        ("sensor_1", window_start + 1000, 2, 75.0),
+        ("sensor_2", window_start + 1000, 1, 69.0),
+        ("sensor_1", window_start + 2000, 1, 75.0),
+    }
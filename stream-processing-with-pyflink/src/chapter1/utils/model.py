@@ -7,16 +7,20 @@ from pyflink.common.typeinfo import Types
 
 from .type_helper import TypeMapping, set_type_info
 
+SENSOR_READING_ROW = Row("id", "timestamp", "num_records", "temperature")
+
 
 @dataclasses.dataclass
 class SensorReading(TypeMapping):
+    __slots__ = ("id", "timestamp", "num_records", "temperature")
+
     id: str
     timestamp: int
     num_records: int
     temperature: float
 
     def to_row(self):
-        return Row(**dataclasses.asdict(self))
+        return SENSOR_READING_ROW(self.id, self.timestamp, self.num_records, self.temperature)
 
     @classmethod
     def from_row(cls, row: Row):
@@ -24,15 +28,14 @@ class SensorReading(TypeMapping):
 
     @staticmethod
     def process_elements(elements: Iterable[Tuple[int, int, datetime.datetime]]):
-        id, count, temperature = None, 0, 0
+        elements = iter(elements)
+        first = next(elements)
+        sensor_id, count, temperature = first[0], 1, first[1] * 0.2 + 65
         for e in elements:
-            next_id = f"sensor_{e[0]}"
-            if id is not None:
-                assert id == next_id
-            id = next_id
+            assert e[0] == sensor_id
             count += 1
-            temperature += 65 + (e[1] / 100 * 20)
-        return id, count, temperature
+            temperature += e[1] * 0.2 + 65
+        return sensor_id, count, temperature
 
     @staticmethod
     def type_mapping():
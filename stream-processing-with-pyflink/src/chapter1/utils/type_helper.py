@@ -5,6 +5,8 @@ from pyflink.common.typeinfo import Types, TypeInformation
 
 
 class TypeMapping(ABC):
+    __slots__ = ()
+
     @abstractstaticmethod
     def type_mapping():
         pass